@@ -136,7 +136,7 @@ class stock():
         
         return(hp)
     
-    def __calculate_indicator(self, indicator, nf, include_flags):
+    def __calculate_indicator(self, indicator, nf, include_flags, df = None):
         
         '''An auxiliary function called by the get_technical_indicators method.
         This function is not meant to be used by the user.
@@ -158,6 +158,14 @@ class stock():
             Whether to include flags for selected indicators.
             Please refer to the get_technical_indicators method's docstring for details
         
+        * df: pandas dataframe or None
+            A dataframe with OHLC prices and volume on which to calculate the indicator.
+            If None (default), the indicator is calculated on the indicators attribute
+            (or on the historical prices, if no indicator has been calculated yet),
+            and the indicators attribute is updated.
+            If a dataframe is given, the indicator is added to it and the indicators
+            attribute is left untouched. This is used for resampled timeframes.
+        
         Returns:
         --------
         An updated version of the indicator attribute, containing the calculated indicator.
@@ -168,11 +176,15 @@ class stock():
         import pandas as pd
         import ta
         
+        #Whether to update the indicators attribute
+        update_self = df is None
+        
         #Initialize dataframe
-        if isinstance(self.indicators, pd.DataFrame):
-            df = self.indicators
-        else:
-            df = self.historical_prices
+        if update_self:
+            if isinstance(self.indicators, pd.DataFrame):
+                df = self.indicators
+            else:
+                df = self.historical_prices
         
         indicator_type, column_name, kwargs = indicator
         if indicator_type == 'sma':
@@ -312,9 +324,126 @@ class stock():
             df[column_name] = ta.trend.trix(df.Close, **kwargs)
         
         #Update indicators table in self
-        self.indicators = df
+        if update_self:
+            self.indicators = df
             
         return(df)
+    
+    def __resample_prices(self, timeframe, holidays = None):
+        
+        '''An auxiliary function called by the get_technical_indicators method.
+        This function is not meant to be used by the user.
+        
+        Resamples the historical prices into OHLC prices and volume of a longer timeframe.
+        
+        Parameters:
+        -----------
+        * timeframe: str
+            A pandas offset alias, such as 'W' (weekly) or 'M' (monthly).
+            Period-end aliases renamed in pandas 2.2 (e.g. 'M' to 'ME')
+            are accepted under both names.
+        
+        * holidays: list or None
+            Dates on which the exchange is closed.
+            Please refer to the get_technical_indicators method's docstring for details.
+        
+        Returns:
+        --------
+        dataframe
+            A pandas dataframe with Open, High, Low, Close and Volume for each period.
+            Each period is indexed by the last date of historical prices it contains,
+            i.e. the first date on which the period's candle is fully known.
+            The first period is dropped if it is incomplete,
+            i.e. if there are business days between the start of that period
+            and the first date of historical prices.
+            Similarly, the last period is dropped if it is still incomplete,
+            i.e. if there are business days left between the last date of historical prices
+            and the end of that period.
+        
+        '''
+        
+        import pandas as pd
+        from pandas.tseries.frequencies import to_offset
+        
+        #pandas 2.2 renamed period-end aliases (e.g. 'M' to 'ME'),
+        #and pandas 3 no longer accepts the old names
+        try:
+            to_offset(timeframe)
+        except ValueError:
+            renamed_aliases = {'M': 'ME', 'BM': 'BME', 'SM': 'SME',
+                               'Q': 'QE', 'BQ': 'BQE',
+                               'A': 'YE', 'Y': 'YE', 'BA': 'BYE', 'BY': 'BYE'}
+            alias, dash, anchor = timeframe.partition('-')
+            timeframe = renamed_aliases.get(alias, alias) + dash + anchor
+        
+        #Business days between two dates (both included),
+        #skipping weekends and, if provided, holidays
+        def business_days(start, end):
+            return(pd.bdate_range(start, end, freq = 'C', holidays = holidays))
+        
+        #Get historical prices
+        #(only OHLC prices and volume, in case indicators were added to this dataframe)
+        df = self.historical_prices.loc[:, ['Open', 'High', 'Low', 'Close', 'Volume']]
+        
+        #Aggregate prices and volume over each period
+        resampler = df.resample(timeframe)
+        resampled = resampler.agg({'Open': 'first',
+                                   'High': 'max',
+                                   'Low': 'min',
+                                   'Close': 'last',
+                                   'Volume': 'sum'})
+        
+        #Last date of historical prices within each period
+        last_dates = pd.Series(df.index, index = df.index).resample(timeframe).last()
+        
+        #Drop periods without any prices (e.g. holidays spanning a whole period)
+        has_prices = resampled.Close.notna()
+        resampled = resampled[has_prices]
+        last_dates = last_dates[has_prices]
+        
+        #Depending on the timeframe, pandas labels periods either by their last day
+        #(e.g. 'W', 'ME') or by their first day (e.g. 'MS', '5D')
+        right_labels = pd.Grouper(freq = timeframe).label == 'right'
+        one_day = pd.Timedelta(days = 1)
+        
+        #Drop the first period if it started before the historical prices,
+        #since its candle would miss the first days of the period
+        if len(resampled) > 0:
+            
+            #First calendar day of the first period
+            first_label = resampled.index[0]
+            if right_labels:
+                period_start = first_label - to_offset(timeframe) + one_day
+            else:
+                period_start = first_label
+            
+            #The period is complete if no business days are missing from its start
+            days_missing = business_days(period_start, df.index[0] - one_day)
+            if not days_missing.empty:
+                resampled = resampled.iloc[1:]
+                last_dates = last_dates.iloc[1:]
+        
+        #Drop the last period if it has not ended yet,
+        #since its candle would still change as new prices come in
+        if len(resampled) > 0:
+            
+            #Last calendar day of the last period
+            last_label = resampled.index[-1]
+            if right_labels:
+                period_end = last_label
+            else:
+                period_end = last_label + to_offset(timeframe) - one_day
+            
+            #The period has ended if no business days are left in it
+            days_left = business_days(df.index[-1] + one_day, period_end)
+            if not days_left.empty:
+                resampled = resampled.iloc[:-1]
+                last_dates = last_dates.iloc[:-1]
+        
+        #Index each period by the date on which it closes
+        resampled.index = pd.DatetimeIndex(last_dates.values, name = df.index.name)
+        
+        return(resampled)
 
         
         
@@ -334,7 +463,9 @@ class stock():
                                                ('trix', None, {'n': 15})],
                                  include_flags = True,
                                  clean_dataframe = True,
-                                 normalize=False):
+                                 normalize=False,
+                                 timeframes = None,
+                                 holidays = None):
         
         
         '''Calculates time series of technical indicators
@@ -386,6 +517,19 @@ class stock():
             If TRUE, indicators measured in monetary units will be divided by the closing price
             each day. Thus, the indicator is shown as a fraction of the stock price.
             See Notes section for a list of indicators that are affected by this parameter.
+        * timeframes: list of str or None
+            If None (default), indicators are calculated on daily prices only.
+            Otherwise, a list of pandas offset aliases, such as ['W', 'M'].
+            For each timeframe, prices are resampled into longer candles
+            and the same indicators are calculated on them.
+            Their columns are named with the timeframe as a suffix e.g. 'rsi_W'.
+            See Notes section for how these indicators are aligned with daily prices.
+        * holidays: list or None
+            Only used if timeframes are given.
+            Dates (other than weekends) on which the exchange is closed, e.g. ['2020-12-31'].
+            They are used to tell whether the first and last periods are complete.
+            If None (default), only weekends are considered non-business days.
+            See Notes section for details.
         
         Returns:
         --------
@@ -445,6 +589,33 @@ class stock():
         -'atr': Average True Range
         -'psar': Parabolic SAR
         -'trix': Triple Exponential Average
+        
+        When timeframes are given, prices are resampled with
+        the first Open, highest High, lowest Low, last Close and total Volume of each period.
+        Indicators for a period only become available on the last day of that period,
+        and are carried forward to the following days until the next period closes.
+        Thus, no day ever sees an indicator calculated on prices from later days.
+        The first period is ignored if it started before the first date of historical prices,
+        i.e. if there are business days between its start and the first date of historical prices.
+        Similarly, the last period is ignored if it has not ended yet,
+        i.e. if there are business days left in it after the last date of historical prices.
+        
+        Unless holidays are provided, a holiday is taken as a business day.
+        Thus, if historical prices end on the last trading day before a holiday
+        (e.g. a Thursday before a Friday holiday, or Dec 30 on exchanges closed on Dec 31),
+        the last period is considered unfinished and ignored,
+        whereas the same period would be shown on that day
+        had historical prices gone further.
+        Provide the exchange's holidays to avoid this difference.
+        
+        Note that long timeframes need long price histories.
+        The Average True Range needs at least n completed periods,
+        and the Average Directional Index needs at least 2n.
+        Moreover, with clean_dataframe = TRUE,
+        every row is dropped until all indicators are available.
+        With the default indicators, this takes 44 periods (due to the Triple Exponential Average),
+        i.e. 44 weeks of historical prices for weekly candles
+        or 44 months of historical prices for monthly candles.
 
         Examples:
         --------
@@ -452,10 +623,21 @@ class stock():
         >>> s.get_stock_historical_prices('30/10/2020', '30/11/2020')
         >>> s.technical_indicators()
         
+        >>> s = stock('petr4','brazil')
+        >>> s.get_stock_historical_prices('01/01/2015', '30/11/2020')
+        >>> s.get_technical_indicators(indicators = [('rsi', None, {'n':14}),
+        ...                                          ('atr', None, {'n':14})],
+        ...                            timeframes = ['W', 'M'])
+        
         Raises:
         -------
         Assertion Error if two columns have the same name
         
+        Assertion Error if timeframes is not a list of unique strings,
+        if historical prices do not cover enough completed periods of some timeframe
+        to calculate the requested indicators,
+        or if clean_dataframe = TRUE drops every row
+        
         References:
         -----------
         
@@ -465,6 +647,7 @@ class stock():
        
         '''
         
+        import pandas as pd
         import ta #technical analysis indicators
         
         #Get historical prices
@@ -482,6 +665,11 @@ class stock():
         
         #assert column names are unique
         assert len(set([i[1] for i in indicators])) == len(indicators), 'Two or more indicators have the same name. Please specify a unique name for each indicator'
+        
+        #assert timeframes are a list of unique pandas offset aliases
+        if timeframes is not None:
+            assert isinstance(timeframes, list) and all(isinstance(t, str) for t in timeframes), 'timeframes must be a list of strings e.g. [\'W\', \'M\']'
+            assert len(set(timeframes)) == len(timeframes), 'Two or more timeframes are the same. Please specify each timeframe only once'
                 
         #setup for normalization
         if normalize:
@@ -501,6 +689,56 @@ class stock():
                               'Low',
                               'Volume'])
         
+        ## Calculate the same indicators for each timeframe requested by user
+        if timeframes is not None:
+            
+            #Number of periods needed to calculate the requested indicators.
+            #Most indicators are calculated (as N/A values) for any number of periods,
+            #but the Average True Range needs n periods and the Average Directional Index needs 2n
+            min_periods = max([1] +
+                              [i[2].get('n', 14) for i in indicators if i[0] == 'atr'] +
+                              [2 * i[2].get('n', 14) for i in indicators if i[0] == 'adx'])
+            
+            list_of_dfs = [df]
+            
+            for timeframe in timeframes:
+                
+                #resample prices into longer candles
+                df_timeframe = self.__resample_prices(timeframe, holidays = holidays)
+                
+                #assert there are enough completed periods to calculate all indicators
+                assert len(df_timeframe) >= min_periods, f'{len(df_timeframe)} completed periods for timeframe {timeframe}, but the requested indicators need at least {min_periods}. Please get historical prices for a longer period'
+                
+                #setup for normalization, using this timeframe's closing prices
+                if normalize:
+                    nf_timeframe = 1/df_timeframe.Close
+                else:
+                    nf_timeframe = 1
+                
+                for i in indicators:
+                    df_timeframe = self.__calculate_indicator(i, 
+                                                              nf = nf_timeframe, 
+                                                              include_flags = include_flags,
+                                                              df = df_timeframe)
+                
+                df_timeframe = df_timeframe.drop(columns=['Open',
+                                                          'Close',
+                                                          'High',
+                                                          'Low',
+                                                          'Volume'])
+                
+                #carry each period's indicators forward from the day it closes
+                df_timeframe = df_timeframe.reindex(df.index, method = 'ffill')
+                
+                #set column names
+                #e.g., rsi_W, for RSI on weekly prices
+                df_timeframe.columns = [name + '_' + timeframe for name in df_timeframe.columns]
+                
+                list_of_dfs.append(df_timeframe)
+            
+            #Concatenate all dataframes
+            df = pd.concat(list_of_dfs, axis=1)
+        
         #remove missing values if user asks for it
         if clean_dataframe:
             #we consider all columns in the dataset,
@@ -511,6 +749,10 @@ class stock():
             #Considering all other columns,
             #drop missing values row-wise
             df = df.dropna(subset = columns_subset)
+            
+            #assert longer timeframes have not dropped every row
+            if timeframes is not None:
+                assert len(df) > 0, 'No row has all indicators available for every timeframe. Please get historical prices for a longer period or set clean_dataframe = False'
         
         #Save new dataset: technical analysis dataframe
         self.indicators = df
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the timeframes option of stock.get_technical_indicators.
+
+Prices are synthetic and set directly as historical_prices,
+so investpy (and an internet connection) is not needed.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stock_class import stock
+
+
+def make_stock(from_date, to_date):
+    '''A stock with synthetic OHLCV prices on every business day between two dates'''
+
+    index = pd.bdate_range(from_date, to_date, name = 'Date')
+    close = 100 + np.arange(len(index), dtype = float)
+
+    s = stock('test', 'nowhere')
+    s.historical_prices = pd.DataFrame({'Open': close - 0.5,
+                                        'High': close + 1,
+                                        'Low': close - 1,
+                                        'Close': close,
+                                        'Volume': np.ones(len(index))},
+                                       index = index)
+    return(s)
+
+
+def period_close(s, timeframe = 'W'):
+    '''Close of each period (sma with n=1), as seen on each day'''
+
+    df = s.get_technical_indicators(indicators = [('sma', 'close', {'n': 1})],
+                                    clean_dataframe = False,
+                                    timeframes = [timeframe])
+    return(df['close_' + timeframe])
+
+
+def test_intra_week_rows_carry_previous_week():
+
+    #Mon 04/01/2021 to Fri 29/01/2021: four full weeks
+    s = make_stock('2021-01-04', '2021-01-29')
+    prices = s.historical_prices.Close.copy()
+    close_w = period_close(s)
+
+    #first week is unknown until its Friday
+    assert close_w.loc['2021-01-04':'2021-01-07'].isna().all()
+    assert close_w.loc['2021-01-08'] == prices.loc['2021-01-08']
+
+    #Monday to Thursday of the second week carry the first week's close
+    assert (close_w.loc['2021-01-11':'2021-01-14'] == prices.loc['2021-01-08']).all()
+    assert close_w.loc['2021-01-15'] == prices.loc['2021-01-15']
+
+
+def test_last_friday_completes_the_week():
+
+    #Data ends on Friday 29/01/2021: the last week is complete
+    s = make_stock('2021-01-04', '2021-01-29')
+    prices = s.historical_prices.Close.copy()
+    close_w = period_close(s)
+
+    assert close_w.iloc[-1] == prices.loc['2021-01-29']
+
+
+def test_unfinished_last_week_is_dropped():
+
+    #Data ends on Wednesday 27/01/2021: the last week is not complete
+    s = make_stock('2021-01-04', '2021-01-27')
+    prices = s.historical_prices.Close.copy()
+    close_w = period_close(s)
+
+    assert (close_w.loc['2021-01-25':] == prices.loc['2021-01-22']).all()
+
+
+def test_last_trading_day_completes_the_month():
+
+    #Sun 31/01/2021: data ending on Friday 29/01/2021 completes January
+    s = make_stock('2020-11-02', '2021-01-29')
+    prices = s.historical_prices.Close.copy()
+    close_m = period_close(s, 'MS')
+
+    assert close_m.iloc[-1] == prices.loc['2021-01-29']
+
+
+def test_unfinished_month_labelled_at_start_is_dropped():
+
+    #'MS' labels months by their first day, which never comes after the last date
+    s = make_stock('2020-11-02', '2021-01-20')
+    prices = s.historical_prices.Close.copy()
+    close_m = period_close(s, 'MS')
+
+    assert (close_m.loc['2021-01-01':] == prices.loc['2020-12-31']).all()
+
+
+def test_invalid_timeframes():
+
+    s = make_stock('2021-01-04', '2021-01-29')
+    indicators = [('sma', 'close', {'n': 1})]
+
+    #a bare string
+    with pytest.raises(AssertionError):
+        s.get_technical_indicators(indicators = indicators, timeframes = 'W')
+
+    #repeated timeframes
+    with pytest.raises(AssertionError):
+        s.get_technical_indicators(indicators = indicators, timeframes = ['W', 'W'])
+
+    #no completed period
+    with pytest.raises(AssertionError, match = '0 completed periods'):
+        s.get_technical_indicators(indicators = indicators, timeframes = ['QS'])
+
+
+def test_partial_first_week_is_dropped():
+
+    #Data starts on Wednesday 06/01/2021: the first week is missing Monday and Tuesday
+    s = make_stock('2021-01-06', '2021-01-29')
+    prices = s.historical_prices.Close.copy()
+    close_w = period_close(s)
+
+    assert close_w.loc[:'2021-01-14'].isna().all()
+    assert close_w.loc['2021-01-15'] == prices.loc['2021-01-15']
+
+
+def test_partial_first_month_is_dropped():
+
+    #Data starts on Monday 16/11/2020: November is incomplete
+    s = make_stock('2020-11-16', '2021-01-29')
+    prices = s.historical_prices.Close.copy()
+    close_m = period_close(s, 'MS')
+
+    assert close_m.loc[:'2020-12-30'].isna().all()
+    assert close_m.loc['2020-12-31'] == prices.loc['2020-12-31']
+
+
+def test_holidays_complete_the_last_week():
+
+    #Friday 10/04/2020 is a holiday: data ending on Thursday completes the week
+    s = make_stock('2020-03-02', '2020-04-09')
+    prices = s.historical_prices.Close.copy()
+
+    df = s.get_technical_indicators(indicators = [('sma', 'close', {'n': 1})],
+                                    clean_dataframe = False,
+                                    timeframes = ['W'])
+    assert df.close_W.iloc[-1] == prices.loc['2020-04-03']
+
+    s = make_stock('2020-03-02', '2020-04-09')
+    df = s.get_technical_indicators(indicators = [('sma', 'close', {'n': 1})],
+                                    clean_dataframe = False,
+                                    timeframes = ['W'],
+                                    holidays = ['2020-04-10'])
+    assert df.close_W.iloc[-1] == prices.loc['2020-04-09']
+
+
+def test_readme_example():
+
+    #Monthly candles need 44 months of history for the default indicators
+    s = make_stock('2016-01-01', '2020-12-31')
+    df = s.get_technical_indicators(timeframes = ['W', 'M'])
+
+    assert len(df) > 0
+    assert {'rsi', 'rsi_W', 'rsi_M', 'trix_M'}.issubset(df.columns)
+    assert df.notna().drop(columns = df.columns[df.columns.str.startswith('psar')]).all().all()
+
+
+def test_too_few_periods():
+
+    #3 years of quarters are fewer than the 28 periods the Average Directional Index needs
+    s = make_stock('2018-01-01', '2020-12-31')
+    with pytest.raises(AssertionError, match = 'need at least 28'):
+        s.get_technical_indicators(timeframes = ['QS'])
+
+
+def test_cleaning_every_row():
+
+    #3 years of months are fewer than the 44 periods the default indicators need
+    s = make_stock('2018-01-01', '2020-12-31')
+    with pytest.raises(AssertionError, match = 'No row'):
+        s.get_technical_indicators(timeframes = ['M'])